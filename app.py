@@ -12,16 +12,62 @@ import webbrowser
 import threading
 import time
 import math
+import os
 import sys
+import hashlib
+from collections import OrderedDict
 from io import StringIO
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+import pure_matrix
+import boundary_simplification
+from output_writers import (CONTENT_TYPES, MATRIX_FORMATS, write_csv, write_fixed_width, write_npy,
+                            write_survey)
+from response_streaming import ResponseStream, accepts_gzip, iter_json, round_floats
+
+# NumPy is optional; without it the matrix endpoints use pure_matrix
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Geographic conversion is vectorized with NumPy and unavailable without it
+try:
+    import coordinate_transform
+except ImportError:
+    coordinate_transform = None
+
+# Recently computed boundaries, so paging and zooming do not recompute them
+BOUNDARY_CACHE_SIZE = 8
+_boundary_cache = OrderedDict()
+_boundary_cache_lock = threading.Lock()
+
 class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
+    # HTTP/1.1 allows chunked responses; connections still close after each
+    # request because the default server handles one connection at a time
+    protocol_version = 'HTTP/1.1'
+    
+    # Decimal places the web interface displays, used for compact responses
+    COMPACT_DECIMALS = {
+        'coordinates': 3,
+        'area_square_meters': 3,
+        'area_acres': 5,
+        'latlon': 8,
+    }
+    COMPACT_MATRIX_DECIMALS = 2
+    
+    def end_headers(self):
+        self.send_header('Connection', 'close')
+        super().end_headers()
+    
     def do_GET(self):
         if self.path == '/' or self.path == '/index.html':
+            page = self.get_main_page().encode()
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', str(len(page)))
             self.end_headers()
-            self.wfile.write(self.get_main_page().encode())
+            self.wfile.write(page)
         else:
             super().do_GET()
     
@@ -32,23 +78,204 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
         try:
             data = json.loads(post_data.decode('utf-8'))
             
-            if self.path == '/calculate_survey':
+            if self.path in ('/export_survey', '/export_matrix'):
+                self.send_export(data)
+                return
+            
+            if self.path == '/calculate_survey' and 'limit' in data:
+                result = self.page_survey(data)
+            elif self.path == '/calculate_survey':
                 result = self.calculate_survey(data)
+            elif self.path == '/simplify_survey':
+                result = self.simplify_survey(data)
             elif self.path == '/calculate_matrix':
                 result = self.calculate_matrix(data)
             else:
                 result = {'error': 'Invalid endpoint'}
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(result).encode())
+            if data.get('compact') and 'error' not in result:
+                result = self.compact_result(result)
+            
+            self.send_json(result)
             
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self.send_json({'error': str(e)}, status=500)
+    
+    def start_stream(self, status, content_type, headers=None):
+        """
+        Send response headers and return a stream for the body.
+        
+        The body is sent with chunked transfer encoding to HTTP/1.1 clients and
+        gzip-compressed when the request's Accept-Encoding allows it.
+        """
+        compress = accepts_gzip(self.headers.get('Accept-Encoding'))
+        chunked = self.request_version != 'HTTP/1.0'
+        
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if compress:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        if chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        
+        return ResponseStream(self.wfile, chunked=chunked, compress=compress)
+    
+    def send_json(self, result, status=200):
+        """Stream a JSON response."""
+        stream = self.start_stream(status, 'application/json')
+        for piece in iter_json(result):
+            stream.write(piece.encode())
+        stream.close()
+    
+    def compact_result(self, result):
+        """Round floats to the decimal places the web interface displays."""
+        if self.path == '/calculate_matrix':
+            return round_floats(result, self.COMPACT_MATRIX_DECIMALS)
+        return {key: round_floats(value, self.COMPACT_DECIMALS[key])
+                if key in self.COMPACT_DECIMALS else value
+                for key, value in result.items()}
+    
+    def send_export(self, data):
+        """Send a survey or matrix result as a downloadable file."""
+        fmt = data.get('format', 'csv')
+        
+        if self.path == '/export_survey':
+            result = self.calculate_survey(data)
+            rows = result.get('coordinates')
+            filename = f'survey.{fmt}'
+        else:
+            result = self.calculate_matrix(data)
+            operation = data.get('operation', 'multiplication')
+            rows = None
+            if operation not in ('addition', 'subtraction', 'multiplication'):
+                result = {'error': f'Unknown operation: {operation}'}
+            elif 'error' not in result:
+                rows = result[operation]['result']
+                if rows is None:
+                    result = {'error': result[operation]['error']}
+            filename = f'{operation}.{fmt}'
+        
+        if fmt not in (CONTENT_TYPES if self.path == '/export_survey' else MATRIX_FORMATS):
+            result = {'error': f'Unsupported export format: {fmt}'}
+        
+        if 'error' in result:
+            self.send_json(result, status=400)
+            return
+        
+        stream = self.start_stream(200, CONTENT_TYPES[fmt], {
+            'Content-Disposition': f'attachment; filename="{filename}"'
+        })
+        if self.path == '/export_survey':
+            write_survey(stream, fmt, rows, result['area_square_meters'], result['area_acres'],
+                         result.get('latlon'))
+        elif fmt == 'csv':
+            write_csv(rows, stream)
+        elif fmt == 'txt':
+            write_fixed_width(rows, stream)
+        else:
+            write_npy(rows, stream)
+        stream.close()
+    
+    def get_boundary(self, data):
+        """
+        Return the cached survey result for a payload, computing it if needed.
+        
+        The entry also holds the vertex importance used for simplification,
+        which is filled in the first time a simplified view is requested.
+        """
+        key = hashlib.sha1(json.dumps([
+            data.get('origin_easting'), data.get('origin_northing'),
+            data.get('distances'), data.get('bearings'), data.get('utm_zone')
+        ]).encode()).hexdigest()
+        
+        with _boundary_cache_lock:
+            entry = _boundary_cache.get(key)
+            if entry is not None:
+                _boundary_cache.move_to_end(key)
+                return entry
+        
+        entry = {'survey': self.calculate_survey(data), 'importance': None, 'order': None}
+        if 'error' in entry['survey']:
+            return entry
+        
+        with _boundary_cache_lock:
+            _boundary_cache[key] = entry
+            while len(_boundary_cache) > BOUNDARY_CACHE_SIZE:
+                _boundary_cache.popitem(last=False)
+        return entry
+    
+    def page_survey(self, data):
+        """Return the survey result with one page of the pillar list."""
+        survey = self.get_boundary(data)['survey']
+        if 'error' in survey:
+            return survey
+        
+        offset = max(0, int(data.get('offset', 0)))
+        limit = max(1, int(data['limit']))
+        coordinates = survey['coordinates']
+        
+        page = {
+            'coordinates': coordinates[offset:offset + limit],
+            'offset': offset,
+            'total_pillars': len(coordinates),
+            'area_square_meters': survey['area_square_meters'],
+            'area_acres': survey['area_acres']
+        }
+        if 'latlon' in survey:
+            page['latlon'] = survey['latlon'][offset:offset + limit]
+        return page
+    
+    def simplify_survey(self, data):
+        """
+        Return a simplified boundary for plotting.
+        
+        With the default Visvalingam method, either max_vertices (a vertex
+        budget) or tolerance (minimum effective area in square meters) selects
+        vertices from the cached importance ranking. The douglas_peucker
+        method takes tolerance as a distance in meters.
+        """
+        entry = self.get_boundary(data)
+        survey = entry['survey']
+        if 'error' in survey:
+            return survey
+        
+        coordinates = survey['coordinates']
+        closed = boundary_simplification.is_closed(coordinates)
+        method = data.get('method', 'visvalingam')
+        
+        if method == 'douglas_peucker':
+            indices = boundary_simplification.douglas_peucker(
+                coordinates, float(data.get('tolerance', 0)))
+        elif method == 'visvalingam':
+            if entry['importance'] is None:
+                importance = boundary_simplification.vertex_importance(coordinates)
+                entry['order'] = boundary_simplification.importance_order(importance)
+                entry['importance'] = importance
+            if 'max_vertices' in data:
+                indices = boundary_simplification.simplify_to_budget(
+                    entry['order'], int(data['max_vertices']), closed=closed)
+            else:
+                indices = boundary_simplification.simplify_by_tolerance(
+                    entry['importance'], float(data.get('tolerance', 0)))
+        else:
+            return {'error': f'Unknown simplification method: {method}'}
+        
+        simplified = [coordinates[i] for i in indices]
+        if closed and indices[-1] == len(coordinates) - 1:
+            # Snap the closing point onto the first so the ring closes exactly
+            simplified[-1] = coordinates[0]
+        
+        return {
+            'coordinates': simplified,
+            'indices': indices,
+            'total_pillars': len(coordinates),
+            'area_square_meters': survey['area_square_meters'],
+            'area_acres': survey['area_acres']
+        }
     
     def calculate_survey(self, data):
         try:
@@ -84,12 +311,20 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
             area_square_meters = abs(area_sum1 - area_sum2) / 2
             area_acres = area_square_meters * 0.000247105
             
-            return {
+            result = {
                 'coordinates': coordinates,
                 'area_square_meters': area_square_meters,
                 'area_acres': area_acres
             }
             
+            if data.get('utm_zone'):
+                if coordinate_transform is None:
+                    raise ValueError("latitude/longitude conversion requires NumPy")
+                result['latlon'] = coordinate_transform.utm_to_latlon(
+                    coordinates, data['utm_zone']).tolist()
+            
+            return result
+            
         except Exception as e:
             return {'error': f'Survey calculation error: {str(e)}'}
     
@@ -98,42 +333,33 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
             matrix_a = data['matrix_a']
             matrix_b = data['matrix_b']
             
-            # Simple matrix operations without numpy
+            exact = bool(data.get('exact', False))
+            
+            # Reject ragged rows up front; zip() in the kernels would truncate them
+            pure_matrix.check_rectangular(matrix_a, 'Matrix A')
+            pure_matrix.check_rectangular(matrix_b, 'Matrix B')
+            
+            # NumPy when installed, otherwise the pure-Python kernels
             def matrix_add(a, b):
                 if len(a) != len(b) or len(a[0]) != len(b[0]):
                     return None, "Matrices must have same dimensions for addition"
-                result = []
-                for i in range(len(a)):
-                    row = []
-                    for j in range(len(a[0])):
-                        row.append(a[i][j] + b[i][j])
-                    result.append(row)
-                return result, None
+                if np is not None:
+                    return (np.array(a, dtype=float) + np.array(b, dtype=float)).tolist(), None
+                return pure_matrix.add_matrices(a, b), None
             
             def matrix_subtract(a, b):
                 if len(a) != len(b) or len(a[0]) != len(b[0]):
                     return None, "Matrices must have same dimensions for subtraction"
-                result = []
-                for i in range(len(a)):
-                    row = []
-                    for j in range(len(a[0])):
-                        row.append(a[i][j] - b[i][j])
-                    result.append(row)
-                return result, None
+                if np is not None:
+                    return (np.array(a, dtype=float) - np.array(b, dtype=float)).tolist(), None
+                return pure_matrix.subtract_matrices(a, b), None
             
             def matrix_multiply(a, b):
                 if len(a[0]) != len(b):
                     return None, "Number of columns in first matrix must equal number of rows in second matrix"
-                result = []
-                for i in range(len(a)):
-                    row = []
-                    for j in range(len(b[0])):
-                        sum_val = 0
-                        for k in range(len(b)):
-                            sum_val += a[i][k] * b[k][j]
-                        row.append(sum_val)
-                    result.append(row)
-                return result, None
+                if np is not None and not exact:
+                    return np.matmul(np.array(a, dtype=float), np.array(b, dtype=float)).tolist(), None
+                return pure_matrix.multiply_matrices(a, b, exact=exact), None
             
             add_result, add_error = matrix_add(matrix_a, matrix_b)
             sub_result, sub_error = matrix_subtract(matrix_a, matrix_b)
@@ -297,6 +523,10 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
                     <label>Origin Northing:</label>
                     <input type="number" id="originNorthing" step="any" required>
                 </div>
+                <div class="form-group">
+                    <label>UTM Zone (optional, e.g. 31N):</label>
+                    <input type="text" id="utmZone" placeholder="Leave blank for grid coordinates only">
+                </div>
                 <div class="form-group">
                     <label>Boundary Lines:</label>
                     <div id="boundaryLines">
@@ -310,8 +540,27 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
                     <button type="button" onclick="removeBoundaryLine()">Remove Line</button>
                 </div>
                 <button type="submit">Calculate Survey</button>
+                <select id="surveyFormat">
+                    <option value="csv">CSV</option>
+                    <option value="txt">Text</option>
+                    <option value="npy">NumPy (.npy)</option>
+                    <option value="geojson">GeoJSON</option>
+                </select>
+                <button type="button" onclick="exportSurvey()">Download</button>
             </form>
             <div id="surveyResults" class="results"></div>
+            <div id="surveyPager" style="display: none;">
+                <button type="button" onclick="changeSurveyPage(-1)">Previous</button>
+                <span id="surveyPageInfo"></span>
+                <button type="button" onclick="changeSurveyPage(1)">Next</button>
+            </div>
+            <h3>Boundary Plot</h3>
+            <canvas id="boundaryPlot" width="600" height="400" style="border: 1px solid #dee2e6;"></canvas>
+            <div>
+                <button type="button" onclick="zoomPlot(2)">Zoom In</button>
+                <button type="button" onclick="zoomPlot(0.5)">Zoom Out</button>
+                <span id="plotInfo"></span>
+            </div>
         </div>
         
         <div id="matrix" class="tab-content">
@@ -331,6 +580,17 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
                 </div>
             </div>
             <button onclick="calculateMatrix()">Calculate Matrix Operations</button>
+            <select id="matrixOperation">
+                <option value="addition">Addition</option>
+                <option value="subtraction">Subtraction</option>
+                <option value="multiplication" selected>Multiplication</option>
+            </select>
+            <select id="matrixFormat">
+                <option value="csv">CSV</option>
+                <option value="txt">Text</option>
+                <option value="npy">NumPy (.npy)</option>
+            </select>
+            <button onclick="exportMatrix()">Download</button>
             <div id="matrixResults" class="results"></div>
         </div>
     </div>
@@ -395,12 +655,33 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
             }
         }
         
-        document.getElementById('surveyForm').addEventListener('submit', function(e) {
-            e.preventDefault();
-            
-            const originEasting = parseFloat(document.getElementById('originEasting').value);
-            const originNorthing = parseFloat(document.getElementById('originNorthing').value);
-            
+        function downloadExport(url, data, errorTarget) {
+            fetch(url, {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify(data)
+            })
+            .then(response => {
+                if (!response.ok) {
+                    return response.json().then(result => { throw new Error(result.error); });
+                }
+                const disposition = response.headers.get('Content-Disposition') || '';
+                const match = disposition.match(/filename="([^"]+)"/);
+                return response.blob().then(blob => {
+                    const link = document.createElement('a');
+                    link.href = URL.createObjectURL(blob);
+                    link.download = match ? match[1] : 'download';
+                    link.click();
+                    URL.revokeObjectURL(link.href);
+                });
+            })
+            .catch(error => {
+                document.getElementById(errorTarget).innerHTML = 
+                    `<div class="error">Error: ${error.message}</div>`;
+            });
+        }
+        
+        function collectSurveyData() {
             const distances = Array.from(document.querySelectorAll('.distance'))
                 .map(input => input.value.trim())
                 .filter(val => val !== '')
@@ -411,18 +692,56 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
                 .filter(val => val !== '')
                 .map(val => parseFloat(val));
             
-            if (distances.length !== bearings.length || distances.length === 0) {
+            const data = {
+                origin_easting: parseFloat(document.getElementById('originEasting').value),
+                origin_northing: parseFloat(document.getElementById('originNorthing').value),
+                distances: distances,
+                bearings: bearings
+            };
+            const utmZone = document.getElementById('utmZone').value.trim();
+            if (utmZone) {
+                data.utm_zone = utmZone;
+            }
+            return data;
+        }
+        
+        function exportSurvey() {
+            const data = collectSurveyData();
+            data.format = document.getElementById('surveyFormat').value;
+            downloadExport('/export_survey', data, 'surveyResults');
+        }
+        
+        document.getElementById('surveyForm').addEventListener('submit', function(e) {
+            e.preventDefault();
+            
+            const data = Object.assign(collectSurveyData(), {compact: true});
+            
+            if (data.distances.length !== data.bearings.length || data.distances.length === 0) {
                 document.getElementById('surveyResults').innerHTML = 
                     '<div class="error">Please enter matching distances and bearings for all boundary lines.</div>';
                 return;
             }
             
-            const data = {
-                origin_easting: originEasting,
-                origin_northing: originNorthing,
-                distances: distances,
-                bearings: bearings
-            };
+            surveyRequest = data;
+            surveyOffset = 0;
+            plotZoom = 1;
+            plotTotal = MAX_PLOT_VERTICES;
+            loadSurveyPage();
+            plotBoundary();
+        });
+        
+        let surveyRequest = null;
+        let surveyOffset = 0;
+        let surveyTotal = 0;
+        let plotZoom = 1;
+        const SURVEY_PAGE_SIZE = 1000;
+        // Zoom and vertex budget caps; past total_pillars a larger budget adds nothing
+        const MAX_PLOT_ZOOM = 64;
+        const MAX_PLOT_VERTICES = 20000;
+        let plotTotal = MAX_PLOT_VERTICES;
+        
+        function loadSurveyPage() {
+            const data = Object.assign({}, surveyRequest, {offset: surveyOffset, limit: SURVEY_PAGE_SIZE});
             
             fetch('/calculate_survey', {
                 method: 'POST',
@@ -435,26 +754,111 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
                     document.getElementById('surveyResults').innerHTML = 
                         `<div class="error">${result.error}</div>`;
                 } else {
+                    surveyTotal = result.total_pillars;
+                    
                     let output = '=== BOUNDARY COORDINATES ===\\n';
                     output += 'Pillar\\tEasting\\t\\tNorthing\\n';
                     output += '----------------------------------------\\n';
                     
                     result.coordinates.forEach((coord, i) => {
-                        output += `${i+1}\\t${coord[0].toFixed(3)}\\t\\t${coord[1].toFixed(3)}\\n`;
+                        output += `${result.offset+i+1}\\t${coord[0].toFixed(3)}\\t\\t${coord[1].toFixed(3)}\\n`;
                     });
                     
+                    if (result.latlon) {
+                        output += '\\n=== GEOGRAPHIC COORDINATES (WGS84) ===\\n';
+                        output += 'Pillar\\tLatitude\\tLongitude\\n';
+                        result.latlon.forEach((coord, i) => {
+                            output += `${result.offset+i+1}\\t${coord[0].toFixed(8)}\\t${coord[1].toFixed(8)}\\n`;
+                        });
+                    }
+                    
                     output += '\\n=== LAND AREA ===\\n';
                     output += `Area: ${result.area_square_meters.toFixed(3)} square meters\\n`;
                     output += `Area: ${result.area_acres.toFixed(5)} acres`;
                     
                     document.getElementById('surveyResults').textContent = output;
+                    
+                    const last = result.offset + result.coordinates.length;
+                    document.getElementById('surveyPageInfo').textContent = 
+                        `Pillars ${result.offset + 1}-${last} of ${surveyTotal}`;
+                    document.getElementById('surveyPager').style.display = 
+                        surveyTotal > SURVEY_PAGE_SIZE ? 'block' : 'none';
                 }
             })
             .catch(error => {
                 document.getElementById('surveyResults').innerHTML = 
                     `<div class="error">Error: ${error.message}</div>`;
             });
-        });
+        }
+        
+        function changeSurveyPage(step) {
+            const offset = surveyOffset + step * SURVEY_PAGE_SIZE;
+            if (surveyRequest && offset >= 0 && offset < surveyTotal) {
+                surveyOffset = offset;
+                loadSurveyPage();
+            }
+        }
+        
+        function zoomPlot(factor) {
+            if (surveyRequest) {
+                plotZoom = Math.min(MAX_PLOT_ZOOM, Math.max(1, plotZoom * factor));
+                plotBoundary();
+            }
+        }
+        
+        function plotBoundary() {
+            const canvas = document.getElementById('boundaryPlot');
+            // Roughly one vertex per pixel of boundary at the current zoom
+            const budget = Math.round(2 * (canvas.width + canvas.height) * plotZoom);
+            const data = Object.assign({}, surveyRequest, {
+                max_vertices: Math.min(budget, plotTotal, MAX_PLOT_VERTICES)
+            });
+            
+            fetch('/simplify_survey', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify(data)
+            })
+            .then(response => response.json())
+            .then(result => {
+                if (result.error) {
+                    return;
+                }
+                plotTotal = result.total_pillars;
+                const coords = result.coordinates;
+                // A loop rather than Math.min(...array), which overflows the
+                // argument limit on long boundaries
+                let minE = Infinity, maxE = -Infinity, minN = Infinity, maxN = -Infinity;
+                coords.forEach(c => {
+                    minE = Math.min(minE, c[0]);
+                    maxE = Math.max(maxE, c[0]);
+                    minN = Math.min(minN, c[1]);
+                    maxN = Math.max(maxN, c[1]);
+                });
+                const span = Math.max(maxE - minE, maxN - minN) || 1;
+                const scale = 0.9 * Math.min(canvas.width, canvas.height) / span * plotZoom;
+                const centerE = (minE + maxE) / 2, centerN = (minN + maxN) / 2;
+                
+                const ctx = canvas.getContext('2d');
+                ctx.clearRect(0, 0, canvas.width, canvas.height);
+                ctx.beginPath();
+                coords.forEach((c, i) => {
+                    const x = canvas.width / 2 + (c[0] - centerE) * scale;
+                    const y = canvas.height / 2 - (c[1] - centerN) * scale;
+                    if (i === 0) {
+                        ctx.moveTo(x, y);
+                    } else {
+                        ctx.lineTo(x, y);
+                    }
+                });
+                ctx.closePath();
+                ctx.strokeStyle = '#007bff';
+                ctx.stroke();
+                
+                document.getElementById('plotInfo').textContent = 
+                    `Showing ${coords.length} of ${result.total_pillars} pillars (zoom ${plotZoom}x)`;
+            });
+        }
         
         function calculateMatrix() {
             const rowsA = parseInt(document.getElementById('matrixARows').value);
@@ -484,7 +888,8 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
             
             const data = {
                 matrix_a: matrixA,
-                matrix_b: matrixB
+                matrix_b: matrixB,
+                compact: true
             };
             
             fetch('/calculate_matrix', {
@@ -548,6 +953,30 @@ class SurveyMatrixHandler(http.server.SimpleHTTPRequestHandler):
             });
         }
         
+        function collectMatrix(name) {
+            const rows = parseInt(document.getElementById(`matrix${name}Rows`).value);
+            const cols = parseInt(document.getElementById(`matrix${name}Cols`).value);
+            const cells = document.querySelectorAll(`#matrix${name}Grid .matrix-cell`);
+            const matrix = [];
+            for (let i = 0; i < rows; i++) {
+                const row = [];
+                for (let j = 0; j < cols; j++) {
+                    row.push(parseFloat(cells[i * cols + j].value) || 0);
+                }
+                matrix.push(row);
+            }
+            return matrix;
+        }
+        
+        function exportMatrix() {
+            downloadExport('/export_matrix', {
+                matrix_a: collectMatrix('A'),
+                matrix_b: collectMatrix('B'),
+                operation: document.getElementById('matrixOperation').value,
+                format: document.getElementById('matrixFormat').value
+            }, 'matrixResults');
+        }
+        
         // Initialize matrix grids
         generateMatrixGrid('A');
         generateMatrixGrid('B');
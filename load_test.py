@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Load Testing Harness for the Survey and Matrix Web Endpoints
+Starts app.py's handler on an ephemeral port and replays a mix of requests.
+Uses Python's built-in modules only.
+"""
+
+import argparse
+import http.client
+import json
+import math
+import queue
+import random
+import socketserver
+import sys
+import threading
+import time
+import zlib
+
+from app import SurveyMatrixHandler
+
+SERVER_MODES = {
+    'single': socketserver.TCPServer,
+    'threaded': socketserver.ThreadingTCPServer,
+}
+
+class QuietHandler(SurveyMatrixHandler):
+    """Request handler that skips per-request access logging."""
+
+    def log_message(self, format, *args):
+        pass
+
+def start_test_server(mode='single'):
+    """
+    Start the web server on an ephemeral localhost port in a background thread.
+
+    Parameters:
+    mode (str): Serving mode, one of the keys of SERVER_MODES
+
+    Returns:
+    socketserver.TCPServer: The running server; call shutdown() when done
+    """
+    httpd = SERVER_MODES[mode](("127.0.0.1", 0), QuietHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+def survey_payload(rng, lines):
+    """Build a /calculate_survey payload with the given number of boundary lines."""
+    return {
+        'origin_easting': rng.uniform(0, 100000),
+        'origin_northing': rng.uniform(0, 100000),
+        'distances': [rng.uniform(1, 500) for _ in range(lines)],
+        'bearings': [rng.uniform(0, 360) for _ in range(lines)],
+    }
+
+def matrix_payload(rng, size):
+    """Build a /calculate_matrix payload with two square matrices of the given size."""
+    return {
+        'matrix_a': [[rng.uniform(-10, 10) for _ in range(size)] for _ in range(size)],
+        'matrix_b': [[rng.uniform(-10, 10) for _ in range(size)] for _ in range(size)],
+    }
+
+def parse_mix(mix):
+    """
+    Parse a request mix such as "survey=3,matrix=1" into endpoint weights.
+
+    Parameters:
+    mix (str): Comma-separated name=weight pairs
+
+    Returns:
+    dict: Mapping of endpoint name ('survey' or 'matrix') to weight
+    """
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ('survey', 'matrix'):
+            raise ValueError(f"Unknown endpoint in mix: {name}")
+        weights[name] = float(weight or 1)
+    return weights
+
+def build_requests(weights, total, survey_lines, matrix_size, seed=0, compact=False):
+    """
+    Pre-generate an encoded request sequence so payload building is not timed.
+
+    A pool of distinct payloads is encoded once per endpoint and the sequence
+    picks from it by weight, so a given seed always replays the same mix.
+
+    Parameters:
+    weights (dict): Endpoint weights from parse_mix()
+    total (int): Number of requests in the sequence
+    survey_lines (int): Boundary lines per survey payload
+    matrix_size (int): Rows and columns per matrix payload
+    seed (int): Random seed
+    compact (bool): Ask the server for compact float formatting
+
+    Returns:
+    list: List of (endpoint_name, path, body_bytes) tuples
+    """
+    rng = random.Random(seed)
+    extra = {'compact': True} if compact else {}
+    pool_size = min(total, 64)
+    pools = {}
+    if 'survey' in weights:
+        pools['survey'] = [('/calculate_survey', json.dumps(dict(survey_payload(rng, survey_lines), **extra)).encode())
+                           for _ in range(pool_size)]
+    if 'matrix' in weights:
+        pools['matrix'] = [('/calculate_matrix', json.dumps(dict(matrix_payload(rng, matrix_size), **extra)).encode())
+                           for _ in range(pool_size)]
+
+    names = list(weights)
+    choices = rng.choices(names, weights=[weights[name] for name in names], k=total)
+    return [(name,) + rng.choice(pools[name]) for name in choices]
+
+def send_request(port, path, body, timeout, gzip=False):
+    """
+    POST one JSON request and read the full response.
+
+    bytes_received counts the body as sent over the wire, so compressed and
+    uncompressed runs can be compared directly.
+
+    Returns:
+    tuple: (ok, bytes_received) where ok is False on a non-200 status,
+           an error field in the response, or a connection failure
+    """
+    headers = {'Content-Type': 'application/json'}
+    if gzip:
+        headers['Accept-Encoding'] = 'gzip'
+
+    try:
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=timeout)
+        connection.request('POST', path, body=body, headers=headers)
+        response = connection.getresponse()
+        payload = response.read()
+        connection.close()
+        head = payload
+        if response.getheader('Content-Encoding') == 'gzip':
+            head = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(payload, 16)
+    except (OSError, http.client.HTTPException, zlib.error):
+        return False, 0
+
+    ok = response.status == 200 and not head.startswith(b'{"error"')
+    return ok, len(payload)
+
+def percentile(sorted_values, fraction):
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def summarize(samples, elapsed):
+    """
+    Reduce (latency_seconds, ok, bytes) samples to throughput, latency and error figures.
+
+    Parameters:
+    samples (list): Request samples
+    elapsed (float): Wall-clock duration of the run in seconds
+
+    Returns:
+    dict: Request counts, throughput, error rate and latency percentiles in milliseconds
+    """
+    latencies = sorted(sample[0] * 1000 for sample in samples)
+    errors = sum(1 for sample in samples if not sample[1])
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': errors / len(samples) if samples else 0.0,
+        'throughput_rps': len(samples) / elapsed if elapsed else 0.0,
+        'bytes_received': sum(sample[2] for sample in samples),
+        'latency_ms': {
+            'mean': sum(latencies) / len(latencies) if latencies else None,
+            'p50': percentile(latencies, 0.50),
+            'p95': percentile(latencies, 0.95),
+            'p99': percentile(latencies, 0.99),
+            'max': latencies[-1] if latencies else None,
+        },
+    }
+
+def run_load(port, requests, concurrency, rate=None, timeout=30.0, gzip=False):
+    """
+    Replay a request sequence against a running server.
+
+    Without a rate, each of the concurrency workers sends its next request as
+    soon as the previous one completes (closed loop). With a rate, requests are
+    scheduled at fixed intervals and latency is measured from the scheduled
+    start, so a backed-up server is not hidden by the generator slowing down.
+
+    Parameters:
+    port (int): Server port on localhost
+    requests (list): Sequence from build_requests()
+    concurrency (int): Number of worker threads
+    rate (float): Target requests per second, or None for closed loop
+    timeout (float): Per-request socket timeout in seconds
+    gzip (bool): Send Accept-Encoding: gzip with every request
+
+    Returns:
+    tuple: (samples, elapsed) where samples is a list of
+           (endpoint_name, latency_seconds, ok, bytes_received)
+    """
+    work = queue.Queue()
+    samples = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+
+    for index, request in enumerate(requests):
+        scheduled = start + index / rate if rate else None
+        work.put((scheduled, request))
+
+    def worker():
+        local = []
+        while True:
+            try:
+                scheduled, (name, path, body) = work.get_nowait()
+            except queue.Empty:
+                break
+            if scheduled is not None:
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            began = scheduled if scheduled is not None else time.perf_counter()
+            ok, received = send_request(port, path, body, timeout, gzip)
+            local.append((name, time.perf_counter() - began, ok, received))
+        with lock:
+            samples.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return samples, time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the survey and matrix web endpoints.")
+    parser.add_argument('--mode', choices=sorted(SERVER_MODES), default='single',
+                        help="serving mode to test")
+    parser.add_argument('--mix', default='survey=1,matrix=1',
+                        help="endpoint weights, e.g. survey=3,matrix=1")
+    parser.add_argument('-n', '--requests', type=int, default=1000, help="total requests")
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help="concurrent clients")
+    parser.add_argument('--rate', type=float, default=None,
+                        help="target requests per second (default: as fast as possible)")
+    parser.add_argument('--survey-lines', type=int, default=20, help="boundary lines per survey request")
+    parser.add_argument('--matrix-size', type=int, default=10, help="rows/columns per matrix request")
+    parser.add_argument('--gzip', action='store_true', help="accept gzip-compressed responses")
+    parser.add_argument('--compact', action='store_true', help="request compact float formatting")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for payloads")
+    parser.add_argument('-o', '--output', default='load_test_results.json', help="results JSON file")
+    args = parser.parse_args(argv)
+
+    weights = parse_mix(args.mix)
+    requests = build_requests(weights, args.requests, args.survey_lines, args.matrix_size,
+                              args.seed, args.compact)
+
+    httpd = start_test_server(args.mode)
+    port = httpd.server_address[1]
+    print(f"Load testing {args.mode} server on port {port}: "
+          f"{args.requests} requests, concurrency {args.concurrency}"
+          + (f", {args.rate:g} req/s" if args.rate else ""))
+
+    try:
+        samples, elapsed = run_load(port, requests, args.concurrency, args.rate, gzip=args.gzip)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    results = {
+        'config': {
+            'mode': args.mode,
+            'mix': weights,
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'rate': args.rate,
+            'survey_lines': args.survey_lines,
+            'matrix_size': args.matrix_size,
+            'gzip': args.gzip,
+            'compact': args.compact,
+            'seed': args.seed,
+            'python': sys.version.split()[0],
+        },
+        'elapsed_seconds': elapsed,
+        'overall': summarize([sample[1:] for sample in samples], elapsed),
+        'endpoints': {
+            name: summarize([sample[1:] for sample in samples if sample[0] == name], elapsed)
+            for name in weights
+        },
+    }
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n{'Endpoint':<10}{'Requests':>10}{'RPS':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Errors':>8}")
+    for name, stats in [('overall', results['overall'])] + list(results['endpoints'].items()):
+        latency = stats['latency_ms']
+        if not stats['requests']:
+            continue
+        print(f"{name:<10}{stats['requests']:>10}{stats['throughput_rps']:>10.1f}"
+              f"{latency['p50']:>10.2f}{latency['p95']:>10.2f}{latency['p99']:>10.2f}"
+              f"{stats['error_rate']:>8.1%}")
+    print(f"\nResults written to {args.output}")
+
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from coordinate_transform import parse_utm_zone, utm_to_latlon
+from output_writers import BUFFER_SIZE, open_output, write_labelled_pillars
+from survey_boundary_calculator import calculate_area, calculate_boundary_coordinates
+
+JOB_EXTENSIONS = ('.json', '.csv')
+
+def find_jobs(directory):
+    """
+    List survey job files in a directory in a stable order.
+
+    Parameters:
+    directory (str): Directory containing .json or .csv job files
+
+    Returns:
+    list: Sorted list of job file paths
+    """
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(JOB_EXTENSIONS)
+    )
+
+def load_job(path):
+    """
+    Read one survey job file.
+
+    JSON jobs use the same fields as the web interface: origin_easting,
+    origin_northing, distances and bearings. CSV jobs hold the origin
+    easting and northing on the first line and one distance,bearing pair
+    per following line.
+
+    Parameters:
+    path (str): Path to the job file
+
+    Returns:
+    tuple: (origin_easting, origin_northing, distances, bearings)
+    """
+    if path.lower().endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return (float(data['origin_easting']), float(data['origin_northing']),
+                [float(d) for d in data['distances']], [float(b) for b in data['bearings']])
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        rows = [row for row in csv.reader(f) if row]
+
+    origin_easting, origin_northing = (float(value) for value in rows[0][:2])
+    distances = [float(row[0]) for row in rows[1:]]
+    bearings = [float(row[1]) for row in rows[1:]]
+    return origin_easting, origin_northing, distances, bearings
+
+def run_job(path, utm_zone=None):
+    """
+    Compute the boundary and area for one job, capturing any error.
+
+    Parameters:
+    path (str): Path to the job file
+    utm_zone (str): If given, also convert the pillars to latitude and longitude
+
+    Returns:
+    dict: Job name, coordinates, latlon (None without a zone), areas and
+          error message (None on success)
+    """
+    name = os.path.basename(path)
+    try:
+        origin_easting, origin_northing, distances, bearings = load_job(path)
+        if len(distances) != len(bearings) or not distances:
+            raise ValueError("job needs matching, non-empty distances and bearings")
+
+        coordinates = calculate_boundary_coordinates(origin_easting, origin_northing,
+                                                     distances, bearings)
+        area_square_meters, area_acres = calculate_area(coordinates)
+        latlon = utm_to_latlon(coordinates, utm_zone).tolist() if utm_zone else None
+        return {'job': name, 'coordinates': coordinates, 'latlon': latlon,
+                'area_square_meters': area_square_meters, 'area_acres': area_acres,
+                'error': None}
+    except Exception as e:
+        return {'job': name, 'coordinates': [], 'latlon': None, 'area_square_meters': None,
+                'area_acres': None, 'error': f'{type(e).__name__}: {e}'}
+
+def run_chunk(paths, utm_zone=None):
+    """
+    Run a chunk of jobs in one worker so each task amortizes its IPC overhead.
+
+    Parameters:
+    paths (list): Job file paths
+    utm_zone (str): Optional UTM zone passed to run_job()
+
+    Returns:
+    list: Results from run_job() in the same order
+    """
+    return [run_job(path, utm_zone) for path in paths]
+
+def chunk_jobs(paths, chunk_size):
+    """
+    Split job paths into consecutive chunks.
+
+    Parameters:
+    paths (list): Job file paths
+    chunk_size (int): Maximum number of jobs per chunk
+
+    Returns:
+    list: List of path lists
+    """
+    return [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+
+def run_batch(paths, workers=None, chunk_size=None, progress=True, utm_zone=None):
+    """
+    Run survey jobs across a process pool.
+
+    Jobs are grouped into chunks so that workers stay busy without one IPC
+    round trip per file. A failure in one job is recorded in its result and
+    does not affect the rest of the batch. Results are returned sorted by job
+    name, so the merged output does not depend on scheduling.
+
+    Parameters:
+    paths (list): Job file paths
+    workers (int): Number of worker processes (defaults to the CPU count)
+    chunk_size (int): Jobs per work unit (defaults to about four chunks per worker)
+    progress (bool): Whether to report progress on stderr
+    utm_zone (str): If given, every job also gets latitude and longitude
+
+    Returns:
+    list: Results from run_job(), sorted by job name
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(paths) // (workers * 4)))
+
+    results = []
+    completed = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_chunk, chunk, utm_zone) for chunk in chunk_jobs(paths, chunk_size)]
+        for future in as_completed(futures):
+            chunk_results = future.result()
+            results.extend(chunk_results)
+            completed += len(chunk_results)
+            if progress:
+                elapsed = time.perf_counter() - start
+                print(f"Processed {completed}/{len(paths)} jobs ({completed / elapsed:.1f} jobs/s)",
+                      file=sys.stderr)
+
+    results.sort(key=lambda result: result['job'])
+    return results
+
+def write_summary(results, path):
+    """
+    Write one CSV row per job with its pillar count, area and error.
+
+    Parameters:
+    results (list): Results from run_batch()
+    path (str): Output CSV path
+    """
+    with open(path, 'w', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(['job', 'pillars', 'area_square_meters', 'area_acres', 'error'])
+        for result in results:
+            if result['error'] is None:
+                writer.writerow([result['job'], len(result['coordinates']),
+                                 f"{result['area_square_meters']:.3f}",
+                                 f"{result['area_acres']:.5f}", ''])
+            else:
+                writer.writerow([result['job'], 0, '', '', result['error']])
+
+def write_pillars(results, path):
+    """
+    Write the pillars of every successful job into one merged CSV file.
+
+    Latitude and longitude columns are added when the batch was run with a
+    UTM zone.
+
+    Parameters:
+    results (list): Results from run_batch()
+    path (str): Output CSV path
+    """
+    geographic = any(result['latlon'] is not None for result in results)
+    with open_output(path) as stream:
+        if geographic:
+            stream.write(b'job,pillar,easting,northing,latitude,longitude\n')
+        else:
+            stream.write(b'job,pillar,easting,northing\n')
+        for result in results:
+            if result['error'] is None:
+                write_labelled_pillars(result['job'], result['coordinates'], stream,
+                                       result['latlon'])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run survey boundary jobs in parallel.")
+    parser.add_argument('directory', help="directory of .json or .csv job files")
+    parser.add_argument('-o', '--output', default='batch', help="output path prefix")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="number of worker processes")
+    parser.add_argument('-c', '--chunk-size', type=int, default=None, help="jobs per work unit")
+    parser.add_argument('-q', '--quiet', action='store_true', help="do not report progress")
+    parser.add_argument('-z', '--utm-zone', default=None,
+                        help="UTM zone of the jobs, e.g. 31N, to add latitude/longitude columns")
+    args = parser.parse_args(argv)
+
+    if args.utm_zone:
+        try:
+            parse_utm_zone(args.utm_zone)
+        except ValueError as e:
+            parser.error(str(e))
+
+    paths = find_jobs(args.directory)
+    print("=== SURVEY BATCH RUNNER ===")
+    print(f"Found {len(paths)} jobs in {args.directory}")
+
+    results = run_batch(paths, workers=args.workers, chunk_size=args.chunk_size,
+                        progress=not args.quiet, utm_zone=args.utm_zone)
+
+    write_summary(results, f"{args.output}_summary.csv")
+    write_pillars(results, f"{args.output}_pillars.csv")
+
+    failed = sum(1 for result in results if result['error'] is not None)
+    print(f"Completed {len(results) - failed} jobs, {failed} failed")
+    print(f"Wrote {args.output}_summary.csv and {args.output}_pillars.csv")
+
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+import heapq
+import math
+
+# Distance in meters within which a boundary's last point closes onto its first
+CLOSURE_TOLERANCE = 1e-6
+
+def _triangle_area(a, b, c):
+    """Return the area of the triangle formed by three (easting, northing) points."""
+    return abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])) / 2
+
+def is_closed(coordinates, tolerance=CLOSURE_TOLERANCE):
+    """
+    Return True if the boundary returns to its first point.
+
+    A traverse computed with sin/cos rarely lands exactly on its origin, so
+    the closing point only has to match within the tolerance on both axes.
+
+    Parameters:
+    coordinates (list): List of (easting, northing) tuples
+    tolerance (float): Maximum difference in meters on each axis
+
+    Returns:
+    bool: Whether the last point repeats the first
+    """
+    if len(coordinates) <= 3:
+        return False
+    (e0, n0), (e1, n1) = coordinates[0], coordinates[-1]
+    return math.isclose(e0, e1, abs_tol=tolerance) and math.isclose(n0, n1, abs_tol=tolerance)
+
+def vertex_importance(coordinates):
+    """
+    Compute the Visvalingam-Whyatt effective area of every vertex.
+
+    Vertices are eliminated smallest-triangle first. Each vertex's importance
+    is the area at which it was removed, raised to at least the previous
+    removal so that importances are monotonic: keeping every vertex with
+    importance >= t gives exactly the line Visvalingam produces for t. The
+    first and last vertices are never removed and get infinite importance.
+
+    A closed ring (see is_closed()) is simplified cyclically over its distinct
+    vertices, so only the first vertex and its closing duplicate are fixed.
+
+    Parameters:
+    coordinates (list): List of (easting, northing) tuples
+
+    Returns:
+    list: Importance of each vertex in square meters
+    """
+    n = len(coordinates)
+    importance = [math.inf] * n
+    if n < 3:
+        return importance
+
+    # Vertices 1..m-1 can be removed; a closed ring wraps around its m distinct vertices
+    closed = is_closed(coordinates)
+    m = n - 1 if closed else n
+    if closed:
+        prev = [(i - 1) % m for i in range(m)]
+        next_ = [(i + 1) % m for i in range(m)]
+        removable = m
+    else:
+        prev = list(range(-1, n - 1))
+        next_ = list(range(1, n + 1))
+        removable = n - 1
+    area = [math.inf] * n
+    heap = []
+
+    for i in range(1, removable):
+        area[i] = _triangle_area(coordinates[prev[i]], coordinates[i], coordinates[next_[i]])
+        heap.append((area[i], i))
+    heapq.heapify(heap)
+
+    last = 0.0
+    while heap:
+        current, i = heapq.heappop(heap)
+        if current != area[i] or importance[i] != math.inf:
+            continue  # stale entry
+
+        last = max(last, current)
+        importance[i] = last
+
+        before, after = prev[i], next_[i]
+        next_[before] = after
+        prev[after] = before
+
+        for j in (before, after):
+            if 0 < j < removable:
+                area[j] = _triangle_area(coordinates[prev[j]], coordinates[j], coordinates[next_[j]])
+                heapq.heappush(heap, (area[j], j))
+
+    return importance
+
+def importance_order(importance):
+    """
+    Rank vertex indices from most to least important.
+
+    Parameters:
+    importance (list): Output of vertex_importance()
+
+    Returns:
+    list: Vertex indices sorted by descending importance
+    """
+    return sorted(range(len(importance)), key=importance.__getitem__, reverse=True)
+
+def simplify_by_tolerance(importance, tolerance):
+    """
+    Select the vertices whose effective area is at least the tolerance.
+
+    Parameters:
+    importance (list): Output of vertex_importance()
+    tolerance (float): Minimum effective area in square meters
+
+    Returns:
+    list: Indices of the kept vertices in boundary order
+    """
+    return [i for i, value in enumerate(importance) if value >= tolerance]
+
+def simplify_to_budget(order, max_vertices, closed=False):
+    """
+    Select the most important vertices up to a vertex budget.
+
+    For a closed ring the closing point does not count against the budget:
+    the distinct vertices are selected and the ring is closed afterwards.
+
+    Parameters:
+    order (list): Output of importance_order()
+    max_vertices (int): Maximum number of vertices to keep (at least 2)
+    closed (bool): Whether the last vertex repeats the first, see is_closed()
+
+    Returns:
+    list: Indices of the kept vertices in boundary order
+    """
+    budget = max(2, max_vertices)
+    if not closed:
+        return sorted(order[:budget])
+
+    # The closing point ties with the first vertex at infinite importance, so
+    # it is within the first budget + 1 entries
+    closing = len(order) - 1
+    kept = [i for i in order[:budget + 1] if i != closing][:budget]
+    return sorted(kept) + [closing]
+
+def douglas_peucker(coordinates, tolerance):
+    """
+    Simplify a line with the Douglas-Peucker algorithm.
+
+    Parameters:
+    coordinates (list): List of (easting, northing) tuples
+    tolerance (float): Maximum perpendicular distance in meters of a dropped vertex
+
+    Returns:
+    list: Indices of the kept vertices in boundary order
+    """
+    n = len(coordinates)
+    if n < 3:
+        return list(range(n))
+
+    keep = [False] * n
+    keep[0] = keep[n - 1] = True
+    stack = [(0, n - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        (e0, n0), (e1, n1) = coordinates[start], coordinates[end]
+        de, dn = e1 - e0, n1 - n0
+        length = math.hypot(de, dn)
+
+        farthest, max_distance = None, tolerance
+        for i in range(start + 1, end):
+            e, nn = coordinates[i]
+            if length:
+                distance = abs(dn * (e - e0) - de * (nn - n0)) / length
+            else:
+                distance = math.hypot(e - e0, nn - n0)
+            if distance > max_distance:
+                farthest, max_distance = i, distance
+
+        if farthest is not None:
+            keep[farthest] = True
+            stack.append((start, farthest))
+            stack.append((farthest, end))
+
+    return [i for i in range(n) if keep[i]]
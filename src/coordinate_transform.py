@@ -0,0 +1,214 @@
+import math
+import re
+from functools import lru_cache
+import numpy as np
+
+# Semi-major axis (m) and inverse flattening
+ELLIPSOIDS = {
+    'WGS84': (6378137.0, 298.257223563),
+    'GRS80': (6378137.0, 298.257222101),
+    'Clarke1880': (6378249.145, 293.465),
+}
+
+UTM_SCALE_FACTOR = 0.9996
+UTM_FALSE_EASTING = 500000.0
+UTM_FALSE_NORTHING_SOUTH = 10000000.0
+UTM_ZONE_PATTERN = re.compile(r'(\d{1,2})\s*([NS]?)')
+
+def _clenshaw_sin(coefficients, angle):
+    """
+    Evaluate Σ c_j sin(2jθ) for j = 1..len(coefficients) by Clenshaw summation.
+
+    Works on complex arrays, so one call applies the series to both the
+    northing and easting parts of the Krüger expansion with a single sin and
+    cos evaluation instead of one per term.
+    """
+    two_cos = 2 * np.cos(2 * angle)
+    b1 = np.zeros_like(angle)
+    b2 = np.zeros_like(angle)
+    for c in reversed(coefficients):
+        b1, b2 = c + two_cos * b1 - b2, b1
+    return b1 * np.sin(2 * angle)
+
+class TransverseMercator:
+    """
+    Transverse Mercator projection using Krüger's series to sixth order in n.
+
+    Accurate to well under a millimeter within a UTM zone. All constants
+    depend only on the ellipsoid and projection parameters and are computed
+    once in the constructor; forward() and inverse() operate on whole arrays.
+    """
+
+    def __init__(self, central_meridian, scale_factor=UTM_SCALE_FACTOR,
+                 false_easting=UTM_FALSE_EASTING, false_northing=0.0, ellipsoid='WGS84'):
+        a, inverse_flattening = ELLIPSOIDS[ellipsoid]
+        f = 1 / inverse_flattening
+        n = f / (2 - f)
+
+        self.central_meridian = math.radians(central_meridian)
+        self.false_easting = false_easting
+        self.false_northing = false_northing
+        self.e = math.sqrt(f * (2 - f))
+
+        # Rectifying radius scaled by k0
+        self.k0_a = scale_factor * a / (1 + n) * (1 + n**2 / 4 + n**4 / 64 + n**6 / 256)
+
+        self.alpha = (
+            n / 2 - 2 * n**2 / 3 + 5 * n**3 / 16 + 41 * n**4 / 180 - 127 * n**5 / 288 + 7891 * n**6 / 37800,
+            13 * n**2 / 48 - 3 * n**3 / 5 + 557 * n**4 / 1440 + 281 * n**5 / 630 - 1983433 * n**6 / 1935360,
+            61 * n**3 / 240 - 103 * n**4 / 140 + 15061 * n**5 / 26880 + 167603 * n**6 / 181440,
+            49561 * n**4 / 161280 - 179 * n**5 / 168 + 6601661 * n**6 / 7257600,
+            34729 * n**5 / 80640 - 3418889 * n**6 / 1995840,
+            212378941 * n**6 / 319334400,
+        )
+        self.beta = (
+            n / 2 - 2 * n**2 / 3 + 37 * n**3 / 96 - n**4 / 360 - 81 * n**5 / 512 + 96199 * n**6 / 604800,
+            n**2 / 48 + n**3 / 15 - 437 * n**4 / 1440 + 46 * n**5 / 105 - 1118711 * n**6 / 3870720,
+            17 * n**3 / 480 - 37 * n**4 / 840 - 209 * n**5 / 4480 + 5569 * n**6 / 90720,
+            4397 * n**4 / 161280 - 11 * n**5 / 504 - 830251 * n**6 / 7257600,
+            4583 * n**5 / 161280 - 108847 * n**6 / 3991680,
+            20648693 * n**6 / 638668800,
+        )
+
+    def forward(self, latitudes, longitudes):
+        """
+        Project geographic coordinates to grid coordinates.
+
+        Parameters:
+        latitudes (array-like): Latitudes in degrees
+        longitudes (array-like): Longitudes in degrees
+
+        Returns:
+        tuple: (eastings, northings) as numpy.ndarray
+        """
+        phi = np.radians(np.asarray(latitudes, dtype=float))
+        lam = np.radians(np.asarray(longitudes, dtype=float)) - self.central_meridian
+
+        sin_phi = np.sin(phi)
+        # Tangent of the conformal latitude
+        tau_prime = np.sinh(np.arctanh(sin_phi) - self.e * np.arctanh(self.e * sin_phi))
+
+        xi_prime = np.arctan2(tau_prime, np.cos(lam))
+        eta_prime = np.arctanh(np.sin(lam) / np.sqrt(1 + tau_prime**2))
+
+        zeta_prime = xi_prime + 1j * eta_prime
+        zeta = zeta_prime + _clenshaw_sin(self.alpha, zeta_prime)
+
+        eastings = self.false_easting + self.k0_a * zeta.imag
+        northings = self.false_northing + self.k0_a * zeta.real
+        return eastings, northings
+
+    def inverse(self, eastings, northings, iterations=4):
+        """
+        Convert grid coordinates back to geographic coordinates.
+
+        Parameters:
+        eastings (array-like): Eastings in meters
+        northings (array-like): Northings in meters
+        iterations (int): Newton iterations for latitude (4 reaches double precision)
+
+        Returns:
+        tuple: (latitudes, longitudes) in degrees as numpy.ndarray
+        """
+        xi = (np.asarray(northings, dtype=float) - self.false_northing) / self.k0_a
+        eta = (np.asarray(eastings, dtype=float) - self.false_easting) / self.k0_a
+
+        zeta = xi + 1j * eta
+        zeta_prime = zeta - _clenshaw_sin(self.beta, zeta)
+        xi_prime, eta_prime = zeta_prime.real, zeta_prime.imag
+
+        sinh_eta = np.sinh(eta_prime)
+        cos_xi = np.cos(xi_prime)
+        tau_prime = np.sin(xi_prime) / np.hypot(sinh_eta, cos_xi)
+        lam = np.arctan2(sinh_eta, cos_xi)
+
+        # Solve for the geodetic latitude tangent by Newton's method
+        e = self.e
+        one_minus_e2 = 1 - e * e
+        tau = tau_prime.copy()
+        for _ in range(iterations):
+            sqrt_tau = np.sqrt(1 + tau**2)
+            sigma = np.sinh(e * np.arctanh(e * tau / sqrt_tau))
+            tau_i = tau * np.sqrt(1 + sigma**2) - sigma * sqrt_tau
+            tau += ((tau_prime - tau_i) / np.sqrt(1 + tau_i**2)
+                    * (1 + one_minus_e2 * tau**2) / (one_minus_e2 * sqrt_tau))
+
+        latitudes = np.degrees(np.arctan(tau))
+        longitudes = np.degrees(lam + self.central_meridian)
+        return latitudes, longitudes
+
+def parse_utm_zone(zone):
+    """
+    Parse a UTM zone such as "31N", "32S" or 31.
+
+    Parameters:
+    zone (str or int): Zone number with optional N/S hemisphere letter (default N)
+
+    Returns:
+    tuple: (zone_number, south)
+
+    Raises:
+    ValueError: If the zone is not in that form, e.g. a latitude band such as "31U"
+    """
+    match = UTM_ZONE_PATTERN.fullmatch(str(zone).strip().upper())
+    if match is None or not 1 <= int(match.group(1)) <= 60:
+        raise ValueError(f"Invalid UTM zone {zone!r}: expected a number from 1 to 60 "
+                         f"optionally followed by N or S, e.g. 31N")
+    return int(match.group(1)), match.group(2) == 'S'
+
+def utm_zone_for_longitude(longitude):
+    """Return the standard UTM zone number containing a longitude in degrees."""
+    return int((longitude + 180) // 6) % 60 + 1
+
+@lru_cache(maxsize=None)
+def utm_projection(zone_number, south=False, ellipsoid='WGS84'):
+    """
+    Return the cached TransverseMercator projection for a UTM zone.
+
+    Parameters:
+    zone_number (int): UTM zone from 1 to 60
+    south (bool): Whether the zone is in the southern hemisphere
+    ellipsoid (str): Key of ELLIPSOIDS
+
+    Returns:
+    TransverseMercator: Projection with the zone's constants precomputed
+    """
+    return TransverseMercator(
+        central_meridian=6 * zone_number - 183,
+        false_northing=UTM_FALSE_NORTHING_SOUTH if south else 0.0,
+        ellipsoid=ellipsoid,
+    )
+
+def utm_to_latlon(coordinates, zone, ellipsoid='WGS84'):
+    """
+    Convert (easting, northing) UTM coordinates to (latitude, longitude).
+
+    Parameters:
+    coordinates (array-like): Sequence of (easting, northing) pairs or an (n, 2) array
+    zone (str or int): UTM zone, e.g. "31N"
+    ellipsoid (str): Key of ELLIPSOIDS
+
+    Returns:
+    numpy.ndarray: (n, 2) array of latitude, longitude in degrees
+    """
+    points = np.asarray(coordinates, dtype=float).reshape(-1, 2)
+    latitudes, longitudes = utm_projection(*parse_utm_zone(zone), ellipsoid).inverse(
+        points[:, 0], points[:, 1])
+    return np.column_stack((latitudes, longitudes))
+
+def latlon_to_utm(coordinates, zone, ellipsoid='WGS84'):
+    """
+    Convert (latitude, longitude) coordinates to UTM (easting, northing).
+
+    Parameters:
+    coordinates (array-like): Sequence of (latitude, longitude) pairs or an (n, 2) array
+    zone (str or int): UTM zone, e.g. "31N"
+    ellipsoid (str): Key of ELLIPSOIDS
+
+    Returns:
+    numpy.ndarray: (n, 2) array of easting, northing in meters
+    """
+    points = np.asarray(coordinates, dtype=float).reshape(-1, 2)
+    eastings, northings = utm_projection(*parse_utm_zone(zone), ellipsoid).forward(
+        points[:, 0], points[:, 1])
+    return np.column_stack((eastings, northings))
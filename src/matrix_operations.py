@@ -1,4 +1,6 @@
+import os
 import numpy as np
+from output_writers import MATRIX_FORMATS, stdout_stream, write_fixed_width, write_output
 
 def input_matrix(matrix_name):
     """
@@ -86,8 +88,33 @@ def display_matrix(matrix, matrix_name):
     matrix_name (str): Name of the matrix for display purposes
     """
     print(f"\n{matrix_name}:")
-    for row in matrix:
-        print(" ".join(f"{val:8.2f}" for val in row))
+    stream = stdout_stream()
+    write_fixed_width(matrix, stream)
+    stream.flush()
+
+def save_results(results, path):
+    """
+    Save each result matrix to its own file next to the given path.
+
+    A path of "results.csv" produces "results_addition.csv",
+    "results_subtraction.csv" and so on; the extension selects the format.
+
+    Parameters:
+    results (dict): Mapping of operation name to result matrix (or None)
+    path (str): Base output path ending in .csv, .txt or .npy
+
+    Raises:
+    ValueError: If the extension is not one of MATRIX_FORMATS; nothing is written
+    """
+    base, extension = os.path.splitext(path)
+    if extension[1:].lower() not in MATRIX_FORMATS:
+        raise ValueError(f"Unsupported output format for matrices: {extension or path}"
+                         f" (use .csv, .txt or .npy)")
+    for operation, matrix in results.items():
+        if matrix is not None:
+            output_path = f"{base}_{operation}{extension}"
+            write_output(output_path, matrix)
+            print(f"Saved {operation} result to {output_path}")
 
 def main():
     print("=== MATRIX OPERATIONS CALCULATOR ===")
@@ -115,6 +142,21 @@ def main():
     result_multiplication = multiply_matrices(matrix_a, matrix_b)
     if result_multiplication is not None:
         display_matrix(result_multiplication, "Matrix A × Matrix B (Multiplication)")
+    
+    # Optional export; ask again on an unsupported extension so results are not lost
+    while True:
+        output_path = input("\nSave results to file (.csv, .txt, .npy) or press Enter to skip: ").strip()
+        if not output_path:
+            break
+        try:
+            save_results({
+                'addition': result_addition,
+                'subtraction': result_subtraction,
+                'multiplication': result_multiplication
+            }, output_path)
+            break
+        except ValueError as e:
+            print(f"Error: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,338 @@
+import json
+import math
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import splu
+
+ARC_SECONDS_PER_RADIAN = 180.0 / math.pi * 3600.0
+
+def load_network(path):
+    """
+    Load a control network description from a JSON file.
+
+    The file must contain approximate coordinates for every station and may
+    list fixed stations, distance observations and bearing observations:
+
+        {
+            "stations": {"A": [1000.0, 2000.0], "B": [1100.0, 2000.0]},
+            "fixed": ["A"],
+            "distances": [["A", "B", 100.012, 0.005]],
+            "bearings": [["A", "B", 90.0, 5.0]]
+        }
+
+    Distances are [from, to, meters, standard error in meters]. Bearings are
+    [from, to, degrees, standard error in arc seconds].
+
+    Parameters:
+    path (str): Path to the JSON network file
+
+    Returns:
+    dict: Network description suitable for adjust_network()
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    return {
+        'stations': {name: (float(e), float(n)) for name, (e, n) in data['stations'].items()},
+        'fixed': list(data.get('fixed', [])),
+        'distances': [tuple(obs) for obs in data.get('distances', [])],
+        'bearings': [tuple(obs) for obs in data.get('bearings', [])],
+    }
+
+def _observation_arrays(observations, station_index, count):
+    """
+    Split a list of (from, to, value, std) observations into NumPy arrays.
+
+    Parameters:
+    observations (list): List of (from, to, value, std) tuples
+    station_index (dict): Mapping of station name to row in the coordinate array
+    count (int): Number of observations
+
+    Returns:
+    tuple: (from_idx, to_idx, values, stds) arrays
+    """
+    from_idx = np.empty(count, dtype=np.int64)
+    to_idx = np.empty(count, dtype=np.int64)
+    values = np.empty(count, dtype=float)
+    stds = np.empty(count, dtype=float)
+
+    for i, (start, end, value, std) in enumerate(observations):
+        from_idx[i] = station_index[start]
+        to_idx[i] = station_index[end]
+        values[i] = value
+        stds[i] = std
+
+    return from_idx, to_idx, values, stds
+
+def _design_matrix(coords, unknown_col, dist_obs, bear_obs):
+    """
+    Build the weighted sparse design matrix and misclosure vector.
+
+    Every observation touches at most four unknowns (easting and northing of
+    its two stations), so the matrix is assembled from COO triplets in a single
+    vectorized pass with no dense intermediate.
+
+    Parameters:
+    coords (numpy.ndarray): Current (n_stations, 2) coordinate estimates
+    unknown_col (numpy.ndarray): Column of each station's easting unknown, or -1 if fixed
+    dist_obs (tuple): Distance observation arrays from _observation_arrays()
+    bear_obs (tuple): Bearing observation arrays from _observation_arrays()
+
+    Returns:
+    tuple: (rows, cols, vals, misclosure) with rows already scaled by 1/std
+    """
+    rows = []
+    cols = []
+    vals = []
+    misclosures = []
+    row_offset = 0
+
+    for kind, (from_idx, to_idx, values, stds) in (('distance', dist_obs), ('bearing', bear_obs)):
+        count = len(values)
+        if count == 0:
+            continue
+
+        delta_easting = coords[to_idx, 0] - coords[from_idx, 0]
+        delta_northing = coords[to_idx, 1] - coords[from_idx, 1]
+        length_sq = delta_easting ** 2 + delta_northing ** 2
+        length = np.sqrt(length_sq)
+        if not np.all(length > 0):
+            raise ValueError(f"A {kind} observation joins two stations at the same position.")
+
+        if kind == 'distance':
+            # d = sqrt(dE² + dN²)
+            d_easting = delta_easting / length
+            d_northing = delta_northing / length
+            misclosure = values - length
+        else:
+            # t = atan2(dE, dN), bearing measured clockwise from north
+            d_easting = delta_northing / length_sq
+            d_northing = -delta_easting / length_sq
+            computed = np.arctan2(delta_easting, delta_northing)
+            misclosure = np.radians(values) - computed
+            misclosure = (misclosure + np.pi) % (2 * np.pi) - np.pi
+
+        weight = 1.0 / stds
+        obs_rows = np.arange(row_offset, row_offset + count)
+
+        for station_idx, sign in ((to_idx, 1.0), (from_idx, -1.0)):
+            col = unknown_col[station_idx]
+            free = col >= 0
+            for offset, partial in ((0, d_easting), (1, d_northing)):
+                rows.append(obs_rows[free])
+                cols.append(col[free] + offset)
+                vals.append(sign * partial[free] * weight[free])
+
+        misclosures.append(misclosure * weight)
+        row_offset += count
+
+    return (np.concatenate(rows), np.concatenate(cols), np.concatenate(vals),
+            np.concatenate(misclosures))
+
+def _normal_inverse_diagonal(factor, size, block_size=256):
+    """
+    Extract the diagonal of the inverse normal matrix from its factorization.
+
+    Only the diagonal is needed for standard errors, so the identity is solved
+    in column blocks and everything but the diagonal is discarded, keeping
+    memory at O(size × block_size) instead of a dense size² inverse. Each of
+    the size right-hand sides is a full triangular solve, so the time grows
+    roughly with size², unlike the adjustment itself.
+
+    Parameters:
+    factor (scipy.sparse.linalg.SuperLU): Factorized normal matrix
+    size (int): Number of unknowns
+    block_size (int): Number of identity columns solved per batch
+
+    Returns:
+    numpy.ndarray: Diagonal of the inverse normal matrix
+    """
+    diagonal = np.empty(size)
+
+    for start in range(0, size, block_size):
+        stop = min(start + block_size, size)
+        rhs = np.zeros((size, stop - start))
+        rhs[np.arange(start, stop), np.arange(stop - start)] = 1.0
+        solution = factor.solve(rhs)
+        diagonal[start:stop] = solution[np.arange(start, stop), np.arange(stop - start)]
+
+    return diagonal
+
+def _check_zero_length(observations, stations, kind):
+    """
+    Reject observations between coincident stations before they reach the solver.
+
+    Parameters:
+    observations (list): List of (from, to, value, std) observations
+    stations (dict): Mapping of station name to approximate (easting, northing)
+    kind (str): 'distance' or 'bearing', used in the error message
+    """
+    for start, end, value, std in observations:
+        if start == end or stations[start] == stations[end]:
+            raise ValueError(f"The {kind} observation {start}-{end} has zero length; "
+                             "its stations coincide.")
+        if kind == 'distance' and value <= 0:
+            raise ValueError(f"The distance observation {start}-{end} must be positive.")
+
+def _check_datum(fixed, distances, bearings):
+    """
+    Check that the fixed stations and observations define a datum.
+
+    A 2D network needs its position (a fixed station), orientation (a bearing
+    or a second fixed station) and scale (a distance or a second fixed
+    station) to be defined, or the normal equations are singular.
+
+    Parameters:
+    fixed (list): Names of stations held fixed
+    distances (list): Distance observations
+    bearings (list): Bearing observations
+    """
+    num_fixed = len(set(fixed))
+    if num_fixed == 0:
+        raise ValueError("Network has no datum: hold at least one station fixed.")
+    if num_fixed < 2 and not bearings:
+        raise ValueError("Network orientation is undefined: add a bearing observation "
+                         "or hold a second station fixed.")
+    if num_fixed < 2 and not distances:
+        raise ValueError("Network scale is undefined: add a distance observation "
+                         "or hold a second station fixed.")
+
+def adjust_network(stations, fixed, distances, bearings, max_iterations=10,
+                   tolerance=1e-4, compute_errors=False):
+    """
+    Adjust a control network by iterated weighted least squares.
+
+    Distance and bearing observations are linearized about the current
+    coordinates, the sparse normal equations N = AᵀA are factorized with a
+    sparse LU, and the corrections are applied until the largest one is below
+    the tolerance.
+
+    Parameters:
+    stations (dict): Mapping of station name to approximate (easting, northing)
+    fixed (list): Names of stations whose coordinates are held fixed
+    distances (list): List of (from, to, distance_m, std_m) observations
+    bearings (list): List of (from, to, bearing_deg, std_arcsec) observations
+    max_iterations (int): Maximum number of Gauss-Newton iterations
+    tolerance (float): Convergence threshold on the largest correction in meters
+    compute_errors (bool): Whether to compute coordinate standard errors. This
+                           costs roughly O(n²) in the number of unknowns, far more
+                           than the adjustment, so it is off by default.
+
+    Returns:
+    dict: Adjusted 'coordinates', 'standard_errors' (None if not computed),
+          'iterations', 'converged', 'variance_factor' and 'redundancy'
+    """
+    names = list(stations)
+    station_index = {name: i for i, name in enumerate(names)}
+    coords = np.array([stations[name] for name in names], dtype=float)
+
+    fixed_mask = np.zeros(len(names), dtype=bool)
+    for name in fixed:
+        fixed_mask[station_index[name]] = True
+
+    unknown_col = np.full(len(names), -1, dtype=np.int64)
+    free_stations = np.flatnonzero(~fixed_mask)
+    unknown_col[free_stations] = 2 * np.arange(len(free_stations))
+    num_unknowns = 2 * len(free_stations)
+
+    dist_obs = _observation_arrays(distances, station_index, len(distances))
+    bear_obs = _observation_arrays(bearings, station_index, len(bearings))
+    num_observations = len(distances) + len(bearings)
+    redundancy = num_observations - num_unknowns
+
+    if num_unknowns == 0:
+        raise ValueError("Network has no free stations to adjust.")
+    _check_datum(fixed, distances, bearings)
+    if redundancy < 0:
+        raise ValueError("Network has fewer observations than unknowns.")
+    _check_zero_length(distances, stations, 'distance')
+    _check_zero_length(bearings, stations, 'bearing')
+
+    # Bearing standard errors are given in arc seconds but enter the
+    # equations in radians
+    bear_obs = bear_obs[:3] + (bear_obs[3] / ARC_SECONDS_PER_RADIAN,)
+
+    converged = False
+    iterations = 0
+    factor = None
+    misclosure = None
+    correction = None
+
+    while iterations < max_iterations:
+        iterations += 1
+
+        rows, cols, vals, misclosure = _design_matrix(coords, unknown_col, dist_obs, bear_obs)
+        design = coo_matrix((vals, (rows, cols)), shape=(num_observations, num_unknowns)).tocsr()
+
+        normal = (design.T @ design).tocsc()
+        try:
+            factor = splu(normal, permc_spec='MMD_AT_PLUS_A')
+        except RuntimeError:
+            raise ValueError("Normal equations are singular: some stations are not "
+                             "fixed in position by the observations.") from None
+        correction = factor.solve(design.T @ misclosure)
+
+        coords[free_stations] += correction.reshape(-1, 2)
+
+        if np.max(np.abs(correction)) < tolerance:
+            converged = True
+            break
+
+    # Residuals after the final correction: v = A·x - w
+    residuals = design @ correction - misclosure
+    if redundancy > 0:
+        variance_factor = float(residuals @ residuals) / redundancy
+    else:
+        variance_factor = 1.0
+
+    standard_errors = None
+    if compute_errors:
+        diagonal = _normal_inverse_diagonal(factor, num_unknowns)
+        sigmas = np.sqrt(variance_factor * diagonal).reshape(-1, 2)
+        standard_errors = {name: (0.0, 0.0) for name in names}
+        for station, (sigma_e, sigma_n) in zip(free_stations, sigmas):
+            standard_errors[names[station]] = (float(sigma_e), float(sigma_n))
+
+    return {
+        'coordinates': {name: (float(e), float(n)) for name, (e, n) in zip(names, coords)},
+        'standard_errors': standard_errors,
+        'iterations': iterations,
+        'converged': converged,
+        'variance_factor': variance_factor,
+        'redundancy': redundancy,
+    }
+
+def main():
+    print("=== SURVEY NETWORK ADJUSTMENT ===")
+    print("This program adjusts a control network by least squares.")
+
+    path = input("\nEnter path to network file (JSON): ")
+    network = load_network(path)
+
+    answer = input("Compute standard errors? Slow for large networks (y/N): ")
+    compute_errors = answer.strip().lower().startswith('y')
+
+    result = adjust_network(network['stations'], network['fixed'],
+                            network['distances'], network['bearings'],
+                            compute_errors=compute_errors)
+
+    status = "converged" if result['converged'] else "did not converge"
+    print(f"\nAdjustment {status} after {result['iterations']} iterations")
+    print(f"Redundancy: {result['redundancy']}")
+    print(f"Variance factor: {result['variance_factor']:.4f}")
+
+    print("\n=== ADJUSTED COORDINATES ===")
+    if compute_errors:
+        print("Station\tEasting\t\tNorthing\tσE (m)\tσN (m)")
+        for name, (easting, northing) in result['coordinates'].items():
+            sigma_e, sigma_n = result['standard_errors'][name]
+            print(f"{name}\t{easting:.3f}\t{northing:.3f}\t{sigma_e:.4f}\t{sigma_n:.4f}")
+    else:
+        print("Station\tEasting\t\tNorthing")
+        for name, (easting, northing) in result['coordinates'].items():
+            print(f"{name}\t{easting:.3f}\t{northing:.3f}")
+
+    return result
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+import struct
+import sys
+from array import array
+
+# Values formatted per block and bytes buffered per stream. A whole block is
+# rendered with a single % operation, which is far cheaper than one f-string
+# and one write call per row. Blocks are sized by value count rather than row
+# count so that memory stays bounded for wide matrices.
+BLOCK_CELLS = 1 << 16
+BUFFER_SIZE = 1 << 20
+
+CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'txt': 'text/plain',
+    'npy': 'application/octet-stream',
+    'geojson': 'application/geo+json',
+}
+# GeoJSON needs boundary pillars, so matrices can only be written in these formats
+MATRIX_FORMATS = ('csv', 'txt', 'npy')
+
+def open_output(path):
+    """
+    Open a file for writing through a large buffer.
+
+    Parameters:
+    path (str): Path of the file to create
+
+    Returns:
+    io.BufferedWriter: Binary stream with a BUFFER_SIZE buffer
+    """
+    return open(path, 'wb', buffering=BUFFER_SIZE)
+
+class TextStreamWriter:
+    """Binary stream adapter that decodes writes onto a text stream."""
+
+    def __init__(self, text_stream):
+        self.text_stream = text_stream
+
+    def write(self, data):
+        self.text_stream.write(data.decode('utf-8'))
+        return len(data)
+
+    def flush(self):
+        self.text_stream.flush()
+
+def stdout_stream():
+    """
+    Return a binary stream that writes to the current sys.stdout.
+
+    Uses the underlying byte buffer when there is one. Text-only replacements
+    for stdout (StringIO, IDLE, Jupyter, test capture) have no buffer and get a
+    decoding adapter instead. Pending text output is flushed first so the two
+    do not interleave; flush the returned stream when done.
+
+    Returns:
+    io.BufferedIOBase or TextStreamWriter: Binary stream for standard output
+    """
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, 'buffer', None)
+    return buffer if buffer is not None else TextStreamWriter(sys.stdout)
+
+def _num_columns(rows):
+    """
+    Return the number of columns in a matrix given as a list of rows or a NumPy array.
+    """
+    shape = getattr(rows, 'shape', None)
+    if shape is not None:
+        return shape[1] if len(shape) > 1 else 1
+    return len(rows[0]) if len(rows) else 0
+
+def _block_rows(rows):
+    """
+    Return how many rows make up one block of about BLOCK_CELLS values.
+    """
+    return max(1, BLOCK_CELLS // max(1, _num_columns(rows)))
+
+def _flatten(block, number_from=None):
+    """
+    Flatten a block of rows into a single list of values.
+
+    Parameters:
+    block (list or numpy.ndarray): Rows to flatten
+    number_from (int): If given, prefix each row with a running row number
+
+    Returns:
+    list: Flat list of values in row order
+    """
+    if number_from is None:
+        if hasattr(block, 'ravel'):
+            return block.ravel().tolist()
+        return [value for row in block for value in row]
+
+    if hasattr(block, 'tolist'):
+        block = block.tolist()
+
+    flat = []
+    for number, row in enumerate(block, number_from):
+        flat.append(number)
+        flat.extend(row)
+    return flat
+
+def _write_rows(stream, rows, row_format, separator='\n', terminator='\n',
+                number_from=None, block_rows=None):
+    """
+    Format rows a block at a time and write them to a binary stream.
+
+    Parameters:
+    stream (io.BufferedIOBase): Binary stream to write to
+    rows (list or numpy.ndarray): Rows of values
+    row_format (str): %-style format for one row
+    separator (str): Text written between rows
+    terminator (str): Text written after the last row
+    number_from (int): If given, each row is prefixed with a running number
+    block_rows (int): Number of rows formatted per block (default: about BLOCK_CELLS values)
+    """
+    total = len(rows)
+    block_rows = block_rows or _block_rows(rows)
+    for start in range(0, total, block_rows):
+        block = rows[start:start + block_rows]
+        numbering = None if number_from is None else number_from + start
+        text = separator.join([row_format] * len(block)) % tuple(_flatten(block, numbering))
+        if start:
+            stream.write(separator.encode())
+        stream.write(text.encode())
+
+    if total and terminator:
+        stream.write(terminator.encode())
+
+def write_csv(rows, stream, header=None, decimals=6):
+    """
+    Write a matrix or coordinate list as CSV.
+
+    Parameters:
+    rows (list or numpy.ndarray): Rows of numeric values
+    stream (io.BufferedIOBase): Binary stream to write to
+    header (list): Optional column names
+    decimals (int or list): Number of decimal places, or one per column
+    """
+    if header:
+        stream.write((','.join(header) + '\n').encode())
+
+    if isinstance(decimals, int):
+        decimals = [decimals] * _num_columns(rows)
+    row_format = ','.join(f'%.{places}f' for places in decimals)
+    _write_rows(stream, rows, row_format)
+
+def write_fixed_width(rows, stream, width=8, decimals=2):
+    """
+    Write a matrix as fixed-width text, matching display_matrix().
+
+    Parameters:
+    rows (list or numpy.ndarray): Rows of numeric values
+    stream (io.BufferedIOBase): Binary stream to write to
+    width (int): Field width of each value
+    decimals (int): Number of decimal places
+    """
+    row_format = ' '.join([f'%{width}.{decimals}f'] * _num_columns(rows))
+    _write_rows(stream, rows, row_format)
+
+def pillar_rows(coordinates, latlon=None):
+    """
+    Combine grid coordinates with optional geographic coordinates row by row.
+
+    Parameters:
+    coordinates (list): List of (easting, northing) tuples
+    latlon (list or numpy.ndarray): Optional rows of (latitude, longitude)
+
+    Returns:
+    list: Rows of (easting, northing) or (easting, northing, latitude, longitude)
+    """
+    if latlon is None:
+        return coordinates
+    return [(easting, northing, latitude, longitude)
+            for (easting, northing), (latitude, longitude) in zip(coordinates, latlon)]
+
+def write_pillars(coordinates, stream, latlon=None):
+    """
+    Write numbered boundary pillars in the survey calculator's table layout.
+
+    Parameters:
+    coordinates (list): List of (easting, northing) tuples
+    stream (io.BufferedIOBase): Binary stream to write to
+    latlon (list or numpy.ndarray): Optional rows of (latitude, longitude) added as columns
+    """
+    if latlon is None:
+        stream.write(b"Pillar\tEasting\t\tNorthing\n")
+        _write_rows(stream, coordinates, '%d\t%.3f\t\t%.3f', number_from=1)
+    else:
+        stream.write(b"Pillar\tEasting\t\tNorthing\t\tLatitude\tLongitude\n")
+        _write_rows(stream, pillar_rows(coordinates, latlon), '%d\t%.3f\t\t%.3f\t\t%.8f\t%.8f',
+                    number_from=1)
+
+def write_labelled_pillars(label, coordinates, stream, latlon=None):
+    """
+    Write numbered pillars as CSV rows prefixed with a label such as a job name.
+
+    Parameters:
+    label (str): Value written in the first column of every row
+    coordinates (list): List of (easting, northing) tuples
+    stream (io.BufferedIOBase): Binary stream to write to
+    latlon (list or numpy.ndarray): Optional rows of (latitude, longitude) added as columns
+    """
+    # Quote the label the way csv.writer does so it matches other CSV outputs
+    if any(char in label for char in ',"\r\n'):
+        label = '"' + label.replace('"', '""') + '"'
+    prefix = label.replace('%', '%%')
+    if latlon is None:
+        _write_rows(stream, coordinates, prefix + ',%d,%.3f,%.3f', number_from=1)
+    else:
+        _write_rows(stream, pillar_rows(coordinates, latlon), prefix + ',%d,%.3f,%.3f,%.8f,%.8f',
+                    number_from=1)
+
+def write_geographic(latlon, stream):
+    """
+    Write numbered pillars as latitude and longitude in degrees.
+
+    Parameters:
+    latlon (list or numpy.ndarray): Rows of (latitude, longitude)
+    stream (io.BufferedIOBase): Binary stream to write to
+    """
+    stream.write(b"Pillar\tLatitude\tLongitude\n")
+    _write_rows(stream, latlon, '%d\t%.8f\t%.8f', number_from=1)
+
+def _npy_header(shape):
+    """
+    Build a version 1.0 .npy header for a little-endian float64 array.
+    """
+    header = repr({'descr': '<f8', 'fortran_order': False, 'shape': tuple(shape)})
+    # Magic (6) + version (2) + length (2) + header + newline, padded to 64 bytes
+    padding = 64 - (10 + len(header) + 1) % 64
+    header = header + ' ' * padding + '\n'
+    return b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode('latin1')
+
+def write_npy(rows, stream, block_rows=None):
+    """
+    Write a matrix as a NumPy .npy file of float64 values.
+
+    NumPy arrays are written directly as little-endian bytes. Lists of rows
+    are packed into array('d') blocks, so NumPy does not need to be installed.
+
+    Parameters:
+    rows (list or numpy.ndarray): Rows of numeric values
+    stream (io.BufferedIOBase): Binary stream to write to
+    block_rows (int): Number of rows packed per block (default: about BLOCK_CELLS values)
+    """
+    stream.write(_npy_header((len(rows), _num_columns(rows))))
+    block_rows = block_rows or _block_rows(rows)
+
+    for start in range(0, len(rows), block_rows):
+        block = rows[start:start + block_rows]
+        if hasattr(block, 'astype'):
+            stream.write(block.astype('<f8').tobytes())
+        else:
+            block = array('d', _flatten(block))
+            if sys.byteorder == 'big':
+                block.byteswap()
+            stream.write(block.tobytes())
+
+def write_geojson(coordinates, stream, area_square_meters=None, area_acres=None, decimals=3):
+    """
+    Write boundary pillars as a GeoJSON FeatureCollection.
+
+    The collection holds one Polygon feature for the closed boundary followed
+    by one Point feature per pillar. Coordinates are written in the order
+    given: grid (easting, northing), or (longitude, latitude) for
+    geographic output, which should use more decimals.
+
+    Parameters:
+    coordinates (list): List of (easting, northing) tuples
+    stream (io.BufferedIOBase): Binary stream to write to
+    area_square_meters (float): Optional parcel area stored on the polygon
+    area_acres (float): Optional parcel area in acres stored on the polygon
+    decimals (int): Number of decimal places per coordinate
+    """
+    point = f'[%.{decimals}f,%.{decimals}f]'
+    properties = {}
+    if area_square_meters is not None:
+        properties['area_square_meters'] = area_square_meters
+    if area_acres is not None:
+        properties['area_acres'] = area_acres
+
+    ring = list(coordinates)
+    if ring and tuple(ring[0]) != tuple(ring[-1]):
+        ring.append(ring[0])
+
+    stream.write(b'{"type":"FeatureCollection","features":[')
+    stream.write(b'{"type":"Feature","geometry":{"type":"Polygon","coordinates":[[')
+    _write_rows(stream, ring, point, separator=',', terminator='')
+    stream.write(b']]},"properties":{')
+    stream.write(','.join(f'"{key}":{float(value)!r}' for key, value in properties.items()).encode())
+    stream.write(b'}}')
+
+    if len(coordinates):
+        stream.write(b',')
+        point_format = ('{"type":"Feature","properties":{"pillar":%d},'
+                        '"geometry":{"type":"Point","coordinates":' + point + '}}')
+        _write_rows(stream, coordinates, point_format, separator=',', terminator='',
+                    number_from=1)
+
+    stream.write(b']}\n')
+
+def write_survey(stream, fmt, coordinates, area_square_meters, area_acres, latlon=None):
+    """
+    Write boundary pillars in an export format, with latitude and longitude if given.
+
+    CSV and .npy exports get latitude and longitude as extra columns and .txt
+    uses the pillar table layout. GeoJSON is written in longitude/latitude
+    when geographic coordinates are given, and in grid coordinates otherwise.
+
+    Parameters:
+    stream (io.BufferedIOBase): Binary stream to write to
+    fmt (str): One of the keys of CONTENT_TYPES
+    coordinates (list): List of (easting, northing) tuples
+    area_square_meters (float): Parcel area stored in GeoJSON output
+    area_acres (float): Parcel area in acres stored in GeoJSON output
+    latlon (list or numpy.ndarray): Optional rows of (latitude, longitude)
+    """
+    if fmt == 'csv':
+        if latlon is None:
+            write_csv(coordinates, stream, header=['easting', 'northing'], decimals=3)
+        else:
+            write_csv(pillar_rows(coordinates, latlon), stream,
+                      header=['easting', 'northing', 'latitude', 'longitude'], decimals=[3, 3, 8, 8])
+    elif fmt == 'txt':
+        write_pillars(coordinates, stream, latlon)
+    elif fmt == 'npy':
+        write_npy(pillar_rows(coordinates, latlon), stream)
+    elif fmt == 'geojson':
+        if latlon is None:
+            write_geojson(coordinates, stream, area_square_meters, area_acres)
+        else:
+            lonlat = [(longitude, latitude) for latitude, longitude in latlon]
+            write_geojson(lonlat, stream, area_square_meters, area_acres, decimals=8)
+    else:
+        raise ValueError(f"Unsupported output format: {fmt}")
+
+def write_output(path, rows, fmt=None):
+    """
+    Write a matrix or coordinate list to a file, choosing the format from its extension.
+
+    Parameters:
+    path (str): Output file path ending in .csv, .txt, .npy or .geojson
+    rows (list or numpy.ndarray): Rows of numeric values
+    fmt (str): Format override; one of the keys of CONTENT_TYPES
+    """
+    fmt = fmt or path.rsplit('.', 1)[-1].lower()
+    if fmt not in CONTENT_TYPES:
+        raise ValueError(f"Unsupported output format: {fmt}")
+
+    with open_output(path) as stream:
+        if fmt == 'csv':
+            write_csv(rows, stream)
+        elif fmt == 'txt':
+            write_fixed_width(rows, stream)
+        elif fmt == 'npy':
+            write_npy(rows, stream)
+        else:
+            write_geojson(rows, stream)
@@ -0,0 +1,135 @@
+import math
+from operator import add, mul, sub
+
+# Products with more multiply-adds than this use the blocked kernel
+BLOCKED_THRESHOLD = 200 ** 3
+BLOCK_SIZE = 128
+
+def check_rectangular(matrix, name='Matrix'):
+    """
+    Check that a matrix is a non-empty list of rows of equal length.
+
+    The kernels zip rows together and would silently truncate ragged input,
+    so call this before choosing one.
+
+    Parameters:
+    matrix (list): Matrix as a list of rows
+    name (str): Name used in the error message
+
+    Returns:
+    tuple: (rows, columns)
+    """
+    if not matrix or not matrix[0]:
+        raise ValueError(f"{name} must have at least one row and one column")
+    columns = len(matrix[0])
+    for number, row in enumerate(matrix, 1):
+        if len(row) != columns:
+            raise ValueError(f"{name} row {number} has {len(row)} values, expected {columns}")
+    return len(matrix), columns
+
+def add_matrices(matrix_a, matrix_b):
+    """
+    Add two matrices given as lists of rows.
+
+    Parameters:
+    matrix_a (list): First matrix
+    matrix_b (list): Second matrix of the same dimensions
+
+    Returns:
+    list: Element-wise sum as a list of rows
+    """
+    return [list(map(add, row_a, row_b)) for row_a, row_b in zip(matrix_a, matrix_b)]
+
+def subtract_matrices(matrix_a, matrix_b):
+    """
+    Subtract the second matrix from the first, both given as lists of rows.
+
+    Parameters:
+    matrix_a (list): First matrix
+    matrix_b (list): Second matrix of the same dimensions
+
+    Returns:
+    list: Element-wise difference as a list of rows
+    """
+    return [list(map(sub, row_a, row_b)) for row_a, row_b in zip(matrix_a, matrix_b)]
+
+def _dot(row, column):
+    return sum(map(mul, row, column))
+
+def _exact_dot(row, column):
+    return math.fsum(map(mul, row, column))
+
+def multiply_transposed(matrix_a, matrix_b, exact=False):
+    """
+    Multiply two matrices by zipping rows of A with rows of Bᵀ.
+
+    Transposing B once turns every inner product into a walk over two
+    contiguous sequences, which map(mul) consumes without any index lookups.
+
+    Parameters:
+    matrix_a (list): m×n matrix
+    matrix_b (list): n×p matrix
+    exact (bool): Accumulate with math.fsum instead of sum
+
+    Returns:
+    list: m×p product as a list of rows
+    """
+    dot = _exact_dot if exact else _dot
+    columns = list(zip(*matrix_b))
+    return [[dot(row, column) for column in columns] for row in matrix_a]
+
+def multiply_blocked(matrix_a, matrix_b, block_size=BLOCK_SIZE):
+    """
+    Multiply two matrices in blocks of the shared dimension and of B's columns.
+
+    Each block pairs a segment of every row of A with the matching segment of
+    a group of B's columns, so the working set stays small for large inputs.
+
+    Parameters:
+    matrix_a (list): m×n matrix
+    matrix_b (list): n×p matrix
+    block_size (int): Block length along the shared dimension and B's columns
+
+    Returns:
+    list: m×p product as a list of rows
+    """
+    inner = len(matrix_b)
+    columns = list(zip(*matrix_b))
+    num_columns = len(columns)
+    k_ranges = [(k, min(k + block_size, inner)) for k in range(0, inner, block_size)]
+
+    # Column segments per k block, prepared once and reused for every row
+    column_segments = [[column[k0:k1] for column in columns] for k0, k1 in k_ranges]
+
+    result = [[0.0] * num_columns for _ in matrix_a]
+
+    for j0 in range(0, num_columns, block_size):
+        j1 = min(j0 + block_size, num_columns)
+        for (k0, k1), segments in zip(k_ranges, column_segments):
+            block = segments[j0:j1]
+            for row, out in zip(matrix_a, result):
+                row_segment = row[k0:k1]
+                for j, column in enumerate(block, j0):
+                    out[j] += sum(map(mul, row_segment, column))
+
+    return result
+
+def multiply_matrices(matrix_a, matrix_b, exact=False):
+    """
+    Multiply two matrices, choosing the kernel from the problem size.
+
+    math.fsum needs every term of an inner product at once, so exact
+    accumulation always uses the transposed kernel.
+
+    Parameters:
+    matrix_a (list): m×n matrix
+    matrix_b (list): n×p matrix
+    exact (bool): Accumulate with math.fsum instead of sum
+
+    Returns:
+    list: m×p product as a list of rows
+    """
+    work = len(matrix_a) * len(matrix_b) * (len(matrix_b[0]) if matrix_b else 0)
+    if work > BLOCKED_THRESHOLD and not exact:
+        return multiply_blocked(matrix_a, matrix_b)
+    return multiply_transposed(matrix_a, matrix_b, exact=exact)
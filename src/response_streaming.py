@@ -0,0 +1,139 @@
+import gzip
+import io
+import json
+
+# Bytes collected before a chunk is sent. Small enough that the first chunk
+# leaves quickly, large enough that chunk framing overhead is negligible.
+CHUNK_SIZE = 64 * 1024
+GZIP_LEVEL = 5
+
+# Rows serialized per json.dumps call when streaming long lists
+JSON_BLOCK_ROWS = 1024
+
+_encoder = json.JSONEncoder(separators=(',', ':'))
+
+def accepts_gzip(accept_encoding):
+    """
+    Check whether an Accept-Encoding header allows a gzip response.
+
+    Parameters:
+    accept_encoding (str): Value of the Accept-Encoding request header
+
+    Returns:
+    bool: True if gzip is listed without q=0
+    """
+    for part in (accept_encoding or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        if coding.strip().lower() not in ('gzip', 'x-gzip'):
+            continue
+        params = params.replace(' ', '')
+        if params.startswith('q='):
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+class ChunkedWriter(io.RawIOBase):
+    """Raw stream that frames every write as an HTTP/1.1 chunk."""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        size = len(data)
+        if size:
+            self.wfile.write(b'%X\r\n' % size + bytes(data) + b'\r\n')
+        return size
+
+    def finish(self):
+        """Send the zero-length chunk that ends the body."""
+        self.wfile.write(b'0\r\n\r\n')
+
+class ResponseStream:
+    """
+    Binary response body writer with optional chunked framing and gzip.
+
+    Data passes through gzip (if enabled), then a CHUNK_SIZE buffer, then
+    chunk framing (if enabled) onto the socket. Call close() once the body is
+    complete; the underlying socket file is left open.
+    """
+
+    def __init__(self, wfile, chunked=True, compress=False):
+        self.chunked = chunked
+        self._raw = ChunkedWriter(wfile) if chunked else wfile
+        self._buffer = io.BufferedWriter(self._raw, buffer_size=CHUNK_SIZE)
+        self._gzip = None
+        if compress:
+            self._gzip = gzip.GzipFile(fileobj=self._buffer, mode='wb',
+                                       compresslevel=GZIP_LEVEL, mtime=0)
+
+    def write(self, data):
+        return (self._gzip or self._buffer).write(data)
+
+    def close(self):
+        if self._gzip is not None:
+            self._gzip.close()
+        self._buffer.flush()
+        if self.chunked:
+            self._raw.finish()
+        self._buffer.detach()
+
+def iter_json(obj, block_rows=JSON_BLOCK_ROWS):
+    """
+    Serialize an object to compact JSON in pieces.
+
+    Dictionaries are walked key by key and long lists are serialized
+    block_rows items at a time, so each piece comes from the C encoder
+    while the full document is never held in memory.
+
+    Parameters:
+    obj: JSON-serializable object
+    block_rows (int): List items serialized per piece
+
+    Returns:
+    generator: Yields str pieces of the JSON document
+    """
+    if isinstance(obj, dict):
+        yield '{'
+        for i, (key, value) in enumerate(obj.items()):
+            yield (',' if i else '') + _encoder.encode(str(key)) + ':'
+            yield from iter_json(value, block_rows)
+        yield '}'
+    elif isinstance(obj, (list, tuple)) and len(obj) > block_rows:
+        yield '['
+        for start in range(0, len(obj), block_rows):
+            piece = _encoder.encode(list(obj[start:start + block_rows]))[1:-1]
+            yield (',' if start else '') + piece
+        yield ']'
+    else:
+        yield _encoder.encode(obj)
+
+def round_floats(obj, decimals):
+    """
+    Round every float in a nested structure of dicts and lists.
+
+    JSON encodes a rounded float by its shortest repr, so 1234.5678901234
+    rounded to 3 decimals is sent as 1234.568.
+
+    Parameters:
+    obj: Nested dicts, lists and tuples of numbers
+    decimals (int): Number of decimal places to keep
+
+    Returns:
+    Same structure with floats rounded; tuples become lists
+    """
+    if isinstance(obj, float):
+        return round(obj, decimals)
+    if isinstance(obj, dict):
+        return {key: round_floats(value, decimals) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        # Rows of plain numbers are the bulk of every result
+        if all(type(value) in (float, int) for value in obj):
+            return [round(value, decimals) for value in obj]
+        return [round_floats(value, decimals) for value in obj]
+    return obj
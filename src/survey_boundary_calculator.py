@@ -1,5 +1,8 @@
 import math
 import numpy as np
+from coordinate_transform import utm_to_latlon
+from output_writers import (CONTENT_TYPES, open_output, stdout_stream, write_geographic,
+                            write_pillars, write_survey)
 
 def calculate_boundary_coordinates(origin_easting, origin_northing, distances, bearings):
     """
@@ -98,9 +101,9 @@ def main():
     
     # Print coordinates
     print("\n=== BOUNDARY COORDINATES ===")
-    print("Pillar\tEasting\t\tNorthing")
-    for i, (easting, northing) in enumerate(coordinates):
-        print(f"{i+1}\t{easting:.3f}\t\t{northing:.3f}")
+    stream = stdout_stream()
+    write_pillars(coordinates, stream)
+    stream.flush()
     
     # Calculate area
     area_square_meters, area_acres = calculate_area(coordinates)
@@ -110,6 +113,26 @@ def main():
     print(f"Area in square meters: {area_square_meters:.3f} m²")
     print(f"Area in acres: {area_acres:.5f} acres")
     
+    # Optional geographic coordinates
+    utm_zone = input("\nEnter UTM zone for latitude/longitude (e.g. 31N) or press Enter to skip: ").strip()
+    latlon = None
+    if utm_zone:
+        latlon = utm_to_latlon(coordinates, utm_zone)
+        print("\n=== GEOGRAPHIC COORDINATES (WGS84) ===")
+        stream = stdout_stream()
+        write_geographic(latlon, stream)
+        stream.flush()
+    
+    # Optional export; latitude/longitude are included when a UTM zone was given
+    output_path = input("\nSave coordinates to file (.csv, .txt, .npy, .geojson) or press Enter to skip: ").strip()
+    if output_path:
+        fmt = output_path.rsplit('.', 1)[-1].lower()
+        if fmt not in CONTENT_TYPES:
+            raise ValueError(f"Unsupported output format: {fmt}")
+        with open_output(output_path) as stream:
+            write_survey(stream, fmt, coordinates, area_square_meters, area_acres, latlon)
+        print(f"Saved coordinates to {output_path}")
+    
     return coordinates, area_square_meters, area_acres
 
 if __name__ == "__main__":